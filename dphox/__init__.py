@@ -5,7 +5,7 @@ from .route import manhattan_route, turn_connect, loopify, spiral_delay
 from .pattern import Pattern, Circle, Ellipse, Box, Sector, Port, text
 from .path import Curve
 from .device import Device
-from .parametric import cubic_taper_fn, dc_path, grating_arc, straight, ring, turn, link, loopback, trombone, \
+from .parametric import cubic_taper_fn, dc_path, grating_arc, grating_arcs, straight, ring, turn, link, loopback, trombone, \
     parametric_curve, cubic_bezier, cubic_taper, circular_bend, euler_bend, spiral, bezier_dc, bezier_sbend, \
     elliptic_bend, turn_sbend, left_turn, left_uturn, right_uturn, right_turn, bent_trombone, linear_taper_fn, \
     quad_taper_fn, arc, taper, mzi_path, polytaper_fn, racetrack, circle, semicircle, ellipse
@@ -903,7 +903,7 @@ class Via(Device):
         via_pattern = Box(self.via_extent, decimals=self.decimals)
         if self.pitch > 0 and self.shape is not None:
             x, y = np.meshgrid(np.arange(self.shape[0]) * self.pitch, np.arange(self.shape[1]) * self.pitch)
-            patterns = [via_pattern.copy.translate(x, y) for x, y in zip(x.flatten(), y.flatten())]
+            patterns = [via_pattern.copy_translated(x, y) for x, y in zip(x.flatten(), y.flatten())]
 
             via_pattern = Pattern(*patterns, decimals=self.decimals)
         boundary = Box((via_pattern.size[0] + 2 * max_boundary_grow,
@@ -1,3 +1,4 @@
+import operator
 
 from .port import Port
 from .transform import AffineTransform, rotate2d, translate2d, reflect2d, skew2d, scale2d
@@ -16,6 +17,26 @@ class Geometry:
         self.curve = None  # reserved for paths.
         self.tangents = [] if tangents is None else tangents
 
+    @property
+    def geoms(self) -> List[np.ndarray]:
+        """The polygons or curves of the geom as a list of :math:`2 \\times N` arrays.
+
+        Note:
+            The :code:`bounds` are cached for the arrays currently in this list (see :code:`bounds`), so the
+            individual arrays should never be modified in place; transforms always assign new arrays instead.
+
+        Returns:
+            The list of geoms.
+
+        """
+        return self._geoms
+
+    @geoms.setter
+    def geoms(self, geoms: List[np.ndarray]):
+        self._geoms = geoms
+        self._bounds = None
+        self._bounds_geoms = ()  # release the previous arrays rather than holding them until bounds is next read
+
     @property
     def points(self) -> np.ndarray:
         return np.hstack(self.geoms) if len(self.geoms) > 0 else np.zeros((2, 0))
@@ -32,15 +53,24 @@ class Geometry:
     def bounds(self) -> Float4:
         """Bounds of the geom.
 
+        Note:
+            The bounds are cached along with the geom arrays they were computed from, and recomputed whenever
+            :code:`geoms` is reassigned or its list of arrays changes (e.g. by :code:`append` or item assignment).
+
         Returns:
             Tuple of the form :code:`(minx, miny, maxx, maxy)`
 
         """
-        p = self.points
-        if p.shape[1] > 0:
-            return np.min(p[0]), np.min(p[1]), np.max(p[0]), np.max(p[1])
-        else:
-            return 0, 0, 0, 0
+        geoms = self.geoms
+        if self._bounds is None or len(self._bounds_geoms) != len(geoms) or \
+                not all(map(operator.is_, self._bounds_geoms, geoms)):
+            p = self.points
+            if p.shape[1] > 0:
+                self._bounds = np.min(p[0]), np.min(p[1]), np.max(p[0]), np.max(p[1])
+            else:
+                self._bounds = 0, 0, 0, 0
+            self._bounds_geoms = tuple(geoms)
+        return self._bounds
 
     @property
     def size(self) -> Float2:
@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 from scipy.special import fresnel
 
@@ -129,11 +131,11 @@ def euler_bend(radius: float, angle: float = 90, resolution: int = DEFAULT_RESOL
 
     """
     sign = np.sign(angle)
-    angle = np.abs(angle / 180 * np.pi)
+    angle = abs(angle / 180 * math.pi)
 
     def _bend(t: np.ndarray):
         z = np.sqrt(angle * t)
-        y, x = fresnel(z / np.sqrt(np.pi / 2))
+        y, x = fresnel(z / math.sqrt(math.pi / 2))
         return radius * np.hstack((x, y * sign)), np.hstack((np.cos(angle * t), np.sin(angle * t) * sign))
 
     return parametric_curve(_bend, resolution=resolution)
@@ -152,7 +154,7 @@ def circular_bend(radius: float, angle: float = 90, resolution: int = DEFAULT_RE
 
     """
     sign = np.sign(angle)
-    angle = np.abs(angle / 180 * np.pi)
+    angle = abs(angle / 180 * math.pi)
 
     def _bend(t: np.ndarray):
         x = radius * np.sin(angle * t)
@@ -192,17 +194,18 @@ def turn(radius: float, angle: float = 90, euler: float = 0, resolution: int = D
     """
     if not 0 <= euler < 1:
         raise ValueError(f"Expected euler parameter to be 0 <= euler < 1 but got {euler}.")
-    if euler <= 0:
+    if euler <= 0 or angle == 0:
+        # a zero angle turn has no euler section to evaluate, so it is just a (degenerate) circular bend
         return circular_bend(radius, angle, resolution)
     euler_angle = euler * angle / 2
     circular_angle = (1 - euler) * angle / 2
 
     euler_curve = euler_bend(1, euler_angle, resolution=int(euler / 2 * resolution))
-    circular_curve = circular_bend(1 / np.sqrt(2 * np.pi * np.radians(np.abs(euler_angle))), circular_angle,
+    circular_curve = circular_bend(1 / math.sqrt(2 * math.pi * math.radians(abs(euler_angle))), circular_angle,
                                    resolution=int((1 - euler) / 2 * resolution))
 
     curve = Curve(euler_curve, circular_curve.to(euler_curve.port['b0'])).symmetrized()
-    scale = radius * 2 * np.sin(np.radians(np.abs(angle)) / 2) / np.linalg.norm(curve.points.T[-1])
+    scale = radius * 2 * math.sin(math.radians(abs(angle)) / 2) / np.linalg.norm(curve.points.T[-1])
     return curve.scale(scale, scale, origin=(0, 0))
 
 
@@ -222,7 +225,7 @@ def arc(angle: float, radius: float, start_angle: float = None, resolution: int
         The function mapping 0 to 1 to the curve/tangents for the arc.
 
     """
-    angle = np.abs(angle / 180 * np.pi)
+    angle = abs(angle / 180 * math.pi)
     start_angle = -angle / 2 if start_angle is None else start_angle
 
     def _arc(t: np.ndarray):
@@ -247,31 +250,61 @@ def grating_arc(angle: float, duty_cycle: float, n_core: float, n_clad: float,
         duty_cycle: duty cycle for the grating
         n_clad: clad material index of refraction.
         n_core: core material index of refraction.
-        fiber_angle: angle of the fiber in degrees from horizontal (not NOT vertical).
+        fiber_angle: angle of the fiber in degrees from horizontal (not vertical).
         wavelength: wavelength accepted by the grating.
         m: grating index.
         resolution: Number of evaluations for the curve.
         include_width: Include the width (paths in the grating arc).
 
     Returns:
-        The function mapping 0 to 1 to the curve/tangents for the provided grating parameters.
+        The curve (or path if :code:`include_width`) for the provided grating parameters.
 
     """
+    return grating_arcs(angle, duty_cycle, n_core, n_clad, fiber_angle, wavelength, min_period=m, num_periods=1,
+                        resolution=resolution, include_width=include_width)
 
-    angle = np.abs(np.radians(angle))
-    fiber_angle = np.abs(np.radians(fiber_angle))
-    n_eff = np.sqrt(duty_cycle * n_core ** 2 + (1 - duty_cycle) * n_clad ** 2)
 
-    def _grating_arc(t: np.ndarray):
-        angles = angle * t - angle / 2
-        radius = m * wavelength / (n_eff - n_clad * np.cos(fiber_angle) * np.cos(angles))
-        x = radius * np.cos(angles)
-        y = radius * np.sin(angles)
-        return np.hstack((x, y))
+def grating_arcs(angle: float, duty_cycle: float, n_core: float, n_clad: float,
+                 fiber_angle: float, wavelength: float, min_period: int, num_periods: int,
+                 resolution: int = DEFAULT_RESOLUTION, include_width: bool = True):
+    """Grating arcs for :code:`num_periods` consecutive grating indices, evaluated all at once.
+
+    This is equivalent to calling :code:`grating_arc` for each grating index from :code:`min_period` to
+    :code:`min_period + num_periods - 1`, but all arcs are evaluated in a single vectorized pass.
+
+    See Also:
+        https://www.ncbi.nlm.nih.gov/pmc/articles/PMC7407772/
+
+    Args:
+        angle: The opening angle of the grating in degrees.
+        duty_cycle: duty cycle for the grating
+        n_clad: clad material index of refraction.
+        n_core: core material index of refraction.
+        fiber_angle: angle of the fiber in degrees from horizontal (not vertical).
+        wavelength: wavelength accepted by the grating.
+        min_period: the first grating index.
+        num_periods: number of grating periods (arcs).
+        resolution: Number of evaluations for each arc.
+        include_width: Include the width (paths in the grating arc).
+
+    Returns:
+        The curve (or path if :code:`include_width`) with one segment per grating arc.
+
+    """
+
+    angle = abs(math.radians(angle))
+    fiber_angle = abs(math.radians(fiber_angle))
+    n_eff = math.sqrt(duty_cycle * n_core ** 2 + (1 - duty_cycle) * n_clad ** 2)
+
+    m = np.arange(min_period, min_period + num_periods)[:, np.newaxis]
+    angles = angle * np.linspace(0, 1, resolution) - angle / 2
+    radius = m * wavelength / (n_eff - n_clad * math.cos(fiber_angle) * np.cos(angles))
+    points = np.stack((radius * np.cos(angles), radius * np.sin(angles)), axis=1)  # (num_periods, 2, resolution)
+    tangents = np.gradient(points, axis=-1)
 
-    width = duty_cycle * wavelength / (n_eff - n_clad * np.cos(fiber_angle))
+    width = duty_cycle * wavelength / (n_eff - n_clad * math.cos(fiber_angle))
 
-    curve = parametric_curve(_grating_arc, resolution)
+    curve = Curve([CurveTuple(p, t) for p, t in zip(points, tangents)])
     return curve.path(width) if include_width else curve
 
 
@@ -288,7 +321,7 @@ def turn_sbend(height: float, radius: float, euler: float = 0, resolution: int =
         The turn sbend curve.
 
     """
-    h = np.abs(height)
+    h = abs(height)
     sign = np.sign(height)
     if h >= 2 * radius:
         angle = 90 * sign
@@ -296,7 +329,7 @@ def turn_sbend(height: float, radius: float, euler: float = 0, resolution: int =
         turn_down = turn(radius, -angle, euler, resolution).to(turn_up.port['b0'])
         return Curve(turn_up, turn_down.transform(translate2d((0, (h - 2 * radius) * sign)))).coalesce()
     else:
-        angle = 180 / np.pi * np.arccos(1 - h / (2 * radius)) * sign
+        angle = 180 / math.pi * math.acos(1 - h / (2 * radius)) * sign
         turn_up = turn(radius, angle, euler, resolution)
         turn_down = turn(radius, -angle, euler, resolution).to(turn_up.port['b0'])
         return Curve(turn_up, turn_down).coalesce()
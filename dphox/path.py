@@ -253,15 +253,20 @@ class Curve(Geometry):
 
     @property
     def copy(self) -> "Curve":
-        """Copies the pattern using deepcopy.
+        """Copies the curve without reevaluating its ports.
+
+        Note:
+            The copy has its own lists of geoms and tangents, ports and refs, but shares the underlying point and
+            tangent arrays with the original. Transforms always assign new arrays rather than modifying them in place,
+            so transforming the copy does not affect the original :code:`Curve`.
 
         Returns:
-            A copy of the Pattern so that changes do not propagate to the original :code:`Pattern`.
+            A copy of the Curve so that transforms do not propagate to the original :code:`Curve`.
 
         """
-        curve = Curve([CurveTuple(g, t) for g, t in zip(self.geoms, self.tangents)])
-        curve.port = self.port_copy
-        curve.refs = [ref.copy for ref in self.refs]
+        # bypass __init__ to avoid recomputing the path ports, which are replaced by the copied ports anyway
+        curve = Curve.__new__(Curve)
+        Geometry.__init__(curve, list(self.geoms), self.port_copy, [ref.copy for ref in self.refs], list(self.tangents))
         return curve
 
 
@@ -4,16 +4,16 @@ from dataclasses import dataclass
 from shapely.affinity import rotate
 from shapely.geometry import box, GeometryCollection, LineString, LinearRing, Point, JOIN_STYLE, CAP_STYLE
 from shapely.ops import split, unary_union, polygonize
-from copy import deepcopy as copy
 
 from .foundry import CommonLayer, Foundry, FABLESS
 from .geometry import Geometry
 from .port import Port
-from typing import List, Optional, Iterable, Union
+from typing import Dict, List, Optional, Iterable, Union
 from .typing import Float2, Float4, MultiPolygon, Polygon, PolygonLike, Shape, Spacing
 from .utils import DECIMALS, fix_dataclass_init_docs, min_aspect_bounds, poly_points, shapely_patch, split_holes
 
 SHAPELYVEC_IMPORTED = True
+SHAPELY2_IMPORTED = True
 GDSPY_IMPORTED = True
 DEFAULT_FOUNDRY = FABLESS
 
@@ -23,6 +23,11 @@ try:
 except ImportError:
     SHAPELYVEC_IMPORTED = False
 
+try:
+    from shapely import linearrings, multipolygons, polygons  # vectorized constructors (shapely >= 2.0)
+except ImportError:
+    SHAPELY2_IMPORTED = False
+
 try:
     import gdspy as gy
 except ImportError:
@@ -43,23 +48,35 @@ class Pattern(Geometry):
         decimals: decimal places for rounding (in case of tiny errors in polygons)
     """
 
-    def __init__(self, *patterns: Union["Pattern", PolygonLike, List[Union[PolygonLike, "Pattern"]]], decimals: int = 6):
+    def __init__(self, *patterns: Union["Pattern", PolygonLike, List[Union[PolygonLike, "Pattern"]]], decimals: int = 6,
+                 refs: Optional[List[Geometry]] = None):
         """Initializer for the pattern class.
 
         Args:
             *patterns: The patterns (Gdspy, Shapely, numpy array, Pattern)
             decimals: decimal places for rounding (in case of tiny errors in polygons)
+            refs: Reference geometries that are transformed along with this pattern (e.g. constituent paths).
         """
         self.decimals = decimals
-        super().__init__(get_ndarray_polygons(patterns), {}, [])
+        super().__init__(get_ndarray_polygons(patterns), {}, [] if refs is None else refs)
 
     @property
     def shapely(self) -> MultiPolygon:
+        if SHAPELY2_IMPORTED and self.geoms:
+            return multipolygons(self._shapely_polygons)
         return MultiPolygon([Polygon(np.around(p.T, decimals=self.decimals)) for p in self.geoms])
 
+    @property
+    def _shapely_polygons(self) -> np.ndarray:
+        """Array of shapely polygons constructed at once from the stacked points (requires shapely >= 2.0)."""
+        points = np.around(self.points.T, decimals=self.decimals)
+        indices = np.repeat(np.arange(len(self.geoms)), [geom.shape[1] for geom in self.geoms])
+        return polygons(linearrings(points, indices=indices))
+
     @property
     def shapely_union(self) -> MultiPolygon:
-        pattern = unary_union(self.shapely.geoms)
+        # with shapely 2.0, union the polygon array directly rather than iterating over the multipolygon's parts
+        pattern = unary_union(self._shapely_polygons if SHAPELY2_IMPORTED and self.geoms else self.shapely.geoms)
         return pattern if isinstance(pattern, MultiPolygon) else MultiPolygon([pattern])
 
     def mask(self, shape: Shape, spacing: Spacing, smooth_feature: float = 0) -> np.ndarray:
@@ -335,7 +352,90 @@ class Pattern(Geometry):
 
     @property
     def copy(self) -> "Pattern":
-        return copy(self)
+        """Copies the pattern without the overhead of deepcopy.
+
+        The polygons, tangents, ports, refs and curve are copied, as are any other attributes that are geometries
+        (or lists/tuples of geometries, e.g. the constituent paths of a prefab pattern) or numpy arrays. A geometry
+        or port shared between several attributes (e.g. a ref that is also an attribute, or a port of this pattern
+        that is also a port of one of its paths) is copied once, so the copy shares it in the same way. Any other
+        attributes (e.g. numbers, strings, devices) are shared with the original.
+
+        Returns:
+            A copy of the Pattern so that changes do not propagate to the original :code:`Pattern`.
+
+        """
+        return self._clone([geom.copy() for geom in self.geoms])
+
+    def copy_translated(self, dx: float = 0, dy: float = 0) -> "Pattern":
+        """Copy and translate the pattern, equivalent to :code:`self.copy.translate(dx, dy)`.
+
+        The translated polygons are computed directly from the original polygons, so the points are only traversed
+        once rather than being copied and then transformed.
+
+        Args:
+            dx: Displacement in x
+            dy: Displacement in y
+
+        Returns:
+            The translated copy of the pattern.
+
+        """
+        shift = np.array(((dx,), (dy,)))
+        pattern = self._clone([np.around(geom + shift, decimals=DECIMALS) for geom in self.geoms])
+        pattern.port = {name: port.translate(dx, dy) for name, port in pattern.port.items()}
+        for ref in pattern.refs:
+            ref.translate(dx, dy)
+        if pattern.curve is not None:
+            pattern.curve.translate(dx, dy)
+        return pattern
+
+    def _clone(self, geoms: List[np.ndarray], memo: Optional[Dict[int, Union[Geometry, Port]]] = None) -> "Pattern":
+        """Clone this pattern with the new polygons :code:`geoms` (see :code:`copy`).
+
+        Args:
+            geoms: The polygons of the clone.
+            memo: Map from the :code:`id` of each geometry and port copied so far to its copy.
+
+        Returns:
+            The cloned pattern.
+
+        """
+        memo = {} if memo is None else memo
+        pattern = self.__class__.__new__(self.__class__)
+        memo[id(self)] = pattern
+        pattern.__dict__.update(self.__dict__)
+        pattern.geoms = geoms
+        pattern.tangents = [tangent.copy() for tangent in self.tangents]
+        pattern.port = {name: _copy_port(port, memo) for name, port in self.port.items()}
+        for name, value in self.__dict__.items():
+            if isinstance(value, np.ndarray):
+                setattr(pattern, name, value.copy())
+            elif isinstance(value, Geometry):
+                setattr(pattern, name, _copy_geometry(value, memo))
+            elif isinstance(value, (list, tuple)) and any(isinstance(v, Geometry) for v in value):
+                setattr(pattern, name, type(value)(_copy_geometry(v, memo) if isinstance(v, Geometry) else v
+                                                   for v in value))
+        pattern.refs = [_copy_geometry(ref, memo) for ref in self.refs]
+        return pattern
+
+
+def _copy_geometry(geom: Geometry, memo: Dict[int, Union[Geometry, Port]]) -> Geometry:
+    """Copy :code:`geom` unless it has already been copied according to :code:`memo` (see :code:`Pattern.copy`)."""
+    if id(geom) not in memo:
+        if isinstance(geom, Pattern):
+            memo[id(geom)] = geom._clone([g.copy() for g in geom.geoms], memo)
+        else:
+            copied = geom.copy
+            copied.port = {name: _copy_port(port, memo) for name, port in geom.port.items()}
+            memo[id(geom)] = copied
+    return memo[id(geom)]
+
+
+def _copy_port(port: Port, memo: Dict[int, Union[Geometry, Port]]) -> Port:
+    """Copy :code:`port` unless it has already been copied according to :code:`memo` (see :code:`Pattern.copy`)."""
+    if id(port) not in memo:
+        memo[id(port)] = port.copy
+    return memo[id(port)]
 
 
 def get_ndarray_polygons(polylike_list: Iterable[Union["Pattern", PolygonLike, List[Union[PolygonLike, "Pattern"]]]],
@@ -480,14 +580,14 @@ class Box(Pattern):
             patterns = [self.hollow(stripe_w)] if pitch[0] > 0 and pitch[1] > 0 else []
         if pitch[0] > 0 and not 3 * pitch[1] >= self.size[0] and along_x:
             xs = np.mgrid[self.bounds[0] + pitch[0]:self.bounds[2]:pitch[0]]
-            patterns.append(
-                Pattern(*[Box(extent=(stripe_w, self.size[1])).halign(x) for x in xs]).align(
-                    self.center))
+            stripe = Box(extent=(stripe_w, self.size[1])).halign(0).geoms[0]
+            offsets = np.stack((xs, np.zeros_like(xs))).T[..., np.newaxis]
+            patterns.append(Pattern(*(stripe[np.newaxis] + offsets)).align(self.center))
         if pitch[1] > 0 and not 3 * pitch[1] >= self.size[1] and along_y:
             ys = np.mgrid[self.bounds[1] + pitch[1]:self.bounds[3]:pitch[1]]
-            patterns.append(
-                Pattern(*[Box(extent=(self.size[0], stripe_w)).valign(y) for y in ys]).align(
-                    self.center))
+            stripe = Box(extent=(self.size[0], stripe_w)).valign(0).geoms[0]
+            offsets = np.stack((np.zeros_like(ys), ys)).T[..., np.newaxis]
+            patterns.append(Pattern(*(stripe[np.newaxis] + offsets)).align(self.center))
         return Pattern(*patterns)
 
     def flexure(self, spring_extent: Float2, connector_extent: Float2 = None,
@@ -602,10 +702,10 @@ class MEMSFlexure(Pattern):
     spring_center: bool=False
 
     def __post_init__(self):
-        super().__init__(Box(self.extent).flexure(self.spring_extent, self.connector_extent,
-                                                                   self.stripe_w, self.spring_center))
         self.box=Box(self.extent)
-        self.refs.append(self.box)
+        super().__init__(Box(self.extent).flexure(self.spring_extent, self.connector_extent,
+                                                                   self.stripe_w, self.spring_center),
+                         refs=[self.box])
 
 
 @ fix_dataclass_init_docs
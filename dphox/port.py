@@ -191,11 +191,20 @@ class Port:
     def copy(self) -> "Port":
         """Return a copy of this port for repeated use.
 
+        Note:
+            Transforms always assign new arrays to :code:`xy`, :code:`xya` and :code:`center` rather than
+            modifying them in place, so the copy can share those arrays with this port instead of reallocating them.
+            As with constructing a new port from :code:`xya`, the position and angle of the copy are taken from
+            :code:`xya` (which may differ from :code:`a` after a :code:`reflect`).
+
         Returns:
-            A deep copy of this port.
+            A copy of this port.
 
         """
-        return Port(*self.xya, self.w, self.z, self.h)
+        port = Port.__new__(Port)
+        port.__dict__.update(self.__dict__)
+        port.x, port.y, port.a = self.xya
+        return port
 
     def orient_xyaf(self, xyaf: np.ndarray, flip_y: bool = False):
         """Orient xyaf (x, y , angle, flip) based on this port.
@@ -269,8 +269,8 @@ class LateralNemsPS(Device):
         top_actuator = self.actuator.copy.to(Port(psw.center[0], psw.bounds[3], 0))
         bottom_actuator = self.actuator.copy.to(Port(psw.center[0], psw.bounds[1], -180))
         if top_actuator.stop_pattern is not None:
-            top_stop_pattern = self.actuator.stop_pattern.copy.translate(dy=self.actuator.translate_dist).to(Port(psw.center[0], psw.bounds[3], 0))
-            bot_stop_pattern = self.actuator.stop_pattern.copy.translate(dy=self.actuator.translate_dist).to(Port(psw.center[0], psw.bounds[1], -180))
+            top_stop_pattern = self.actuator.stop_pattern.copy_translated(dy=self.actuator.translate_dist).to(Port(psw.center[0], psw.bounds[3], 0))
+            bot_stop_pattern = self.actuator.stop_pattern.copy_translated(dy=self.actuator.translate_dist).to(Port(psw.center[0], psw.bounds[1], -180))
             clearout = Clearout(
                 clearout_etch=self.clearout.clearout_etch.align(psw) - (top_stop_pattern + bot_stop_pattern),
                 clearout_etch_stop_grow=self.clearout.clearout_etch_stop_grow,
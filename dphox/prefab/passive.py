@@ -1,16 +1,38 @@
+import math
 from dataclasses import dataclass
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Optional, Tuple, Union
 
 import numpy as np
 
 from ..device import Device
 from ..foundry import AIR, CommonLayer, SILICON
-from ..parametric import cubic_taper, cubic_taper_fn, dc_path, grating_arc, link, loopback, straight, trombone, turn
+from ..parametric import cubic_taper, cubic_taper_fn, dc_path, grating_arcs, link, loopback, straight, trombone, turn
 from ..pattern import Box, Pattern, Port
 from ..typing import Float2, Int2
 from ..utils import fix_dataclass_init_docs
 
 
+@lru_cache(maxsize=1024)
+def _dc_paths(waveguide_w: float, coupler_waveguide_w: float, radius: float, interport_distance: float,
+              gap_w: float, interaction_l: float, euler: float, end_l: float) -> Tuple[Pattern, Pattern]:
+    """Lower and upper waveguide paths of a directional coupler, cached since many identical couplers appear in
+    large layouts.
+
+    Note:
+        The returned paths are shared between calls, so make sure to copy them before transforming them.
+
+    """
+    w, cw = waveguide_w, coupler_waveguide_w
+    width = (w, cubic_taper_fn(w, cw), cw, cubic_taper_fn(cw, w), w) if cw != w else w
+    dy = (interport_distance - gap_w - cw) / 2
+    lower_path = link(end_l, dc_path(radius, dy, interaction_l, euler), end_l).path(width)
+    # evaluate the upper path rather than reflecting the lower path, since reflect does not fix the curve port angles
+    upper_path = link(end_l, dc_path(radius, -dy, interaction_l, euler), end_l).path(width)
+    upper_path.translate(dx=0, dy=interport_distance)
+    return lower_path, upper_path
+
+
 @fix_dataclass_init_docs
 @dataclass
 class DC(Pattern):
@@ -43,14 +65,10 @@ class DC(Pattern):
 
     def __post_init__(self):
         self.coupler_waveguide_w = self.waveguide_w if self.coupler_waveguide_w is None else self.coupler_waveguide_w
-        cw = self.coupler_waveguide_w
-        w = self.waveguide_w
-        radius, dy = (self.radius, (self.interport_distance - self.gap_w - self.coupler_waveguide_w) / 2)
-        width = (w, cubic_taper_fn(w, cw), cw, cubic_taper_fn(cw, w), w) if cw != w else w
-        lower_path = link(self.end_l, dc_path(radius, dy, self.interaction_l, self.euler), self.end_l).path(width)
-        upper_path = link(self.end_l, dc_path(radius, -dy, self.interaction_l, self.euler), self.end_l).path(width)
-        upper_path.translate(dx=0, dy=self.interport_distance)
-        super().__init__(lower_path, upper_path)
+        lower_path, upper_path = (path.copy for path in _dc_paths(self.waveguide_w, self.coupler_waveguide_w,
+                                                                  self.radius, self.interport_distance, self.gap_w,
+                                                                  self.interaction_l, self.euler, self.end_l))
+        super().__init__(lower_path, upper_path, refs=[lower_path, upper_path])
         self.lower_path, self.upper_path = lower_path, upper_path
         self.port['a0'] = Port(0, 0, -180, w=self.waveguide_w)
         self.port['a1'] = Port(0, self.interport_distance, -180, w=self.waveguide_w)
@@ -58,19 +76,26 @@ class DC(Pattern):
         self.port['b1'] = Port(self.size[0], self.interport_distance, w=self.waveguide_w)
         self.lower_path.port = {'a0': self.port['a0'].copy, 'b0': self.port['b0'].copy}
         self.upper_path.port = {'a0': self.port['a1'].copy, 'b0': self.port['b1'].copy}
-        self.refs.extend([self.lower_path, upper_path])
 
     @property
     def interaction_points(self) -> np.ndarray:
-        bl = np.asarray(self.center) - np.asarray((self.interaction_l, self.waveguide_w + self.gap_w)) / 2
-        tl = bl + np.asarray((0, self.waveguide_w + self.gap_w))
-        br = bl + np.asarray((self.interaction_l, 0))
-        tr = tl + np.asarray((self.interaction_l, 0))
-        return np.vstack((bl, tl, br, tr))
+        cx, cy = self.center
+        dx, dy = self.interaction_l / 2, (self.waveguide_w + self.gap_w) / 2
+        points = np.empty((4, 2))
+        points[0] = cx - dx, cy - dy  # bottom left
+        points[1] = cx - dx, cy + dy  # top left
+        points[2] = cx + dx, cy - dy  # bottom right
+        points[3] = cx + dx, cy + dy  # top right
+        return points
 
     @property
     def path_array(self):
-        return np.array([self.polygons[:3], self.polygons[3:]])
+        # fill a flat object array so polygons of equal shape are not merged into a numeric array, then view as
+        # (lower path polygons, upper path polygons)
+        path_array = np.empty(len(self.geoms), dtype=object)
+        for idx, geom in enumerate(self.geoms):
+            path_array[idx] = geom
+        return path_array.reshape(2, -1)
 
     def device(self, layer: str = CommonLayer.RIDGE_SI):
         device = Device('dc', [(self, layer)])
@@ -120,11 +145,14 @@ class Array(Pattern):
     pitch: Optional[Union[float, Float2]] = None
 
     def __post_init__(self):
-        self.pitch = np.array(self.unit.size) * 2 if self.pitch is None else self.pitch
-        self.pitch = (self.pitch, self.pitch) if np.isscalar(self.pitch) else self.pitch
-        super().__init__([self.unit.copy.translate(i * self.pitch[0], j * self.pitch[1])
-                          for i in range(self.grid_shape[0]) for j in range(self.grid_shape[1])
-                          ])
+        pitch = np.array(self.unit.size) * 2 if self.pitch is None else self.pitch
+        self.pitch = np.broadcast_to(np.asarray(pitch, dtype=np.float64), (2,)).copy()
+        offsets = (np.indices(self.grid_shape).reshape(2, -1).T * self.pitch)[..., np.newaxis]  # (num_cells, 2, 1)
+        # broadcast the unit's flat point buffer over all grid offsets at once rather than copying and translating
+        # the unit per cell, then split the result back into per-polygon views of shape (num_cells, 2, num_points)
+        split = np.cumsum([geom.shape[1] for geom in self.unit.geoms])[:-1]
+        cells = np.split(self.unit.points[np.newaxis] + offsets, split, axis=-1)
+        super().__init__(*[cell[idx] for idx in range(offsets.shape[0]) for cell in cells])
 
 
 @fix_dataclass_init_docs
@@ -212,8 +240,10 @@ class StraightGrating(Device):
 
     def __post_init__(self):
         self.stripe_w = self.pitch * (1 - self.duty_cycle)
-        slab = (Box(self.extent).hstack(self.waveguide).buffer(self.rib_grow), self.slab)
-        grating = (Box(self.extent).hstack(self.waveguide).striped(self.stripe_w, (self.pitch, 0)), self.ridge)
+        box = Box(self.extent).hstack(self.waveguide)
+        # buffer(0) still runs a full union through shapely, so skip it when there is no rib growth
+        slab = (box if self.rib_grow == 0 else box.buffer(self.rib_grow), self.slab)
+        grating = (box.striped(self.stripe_w, (self.pitch, 0)), self.ridge)
         super().__init__(self.name, [slab, grating, (self.waveguide, self.ridge)])
         self.port['a0'] = self.waveguide.port['a0'].copy
 
@@ -259,18 +289,20 @@ class FocusingGrating(Device):
     slab: CommonLayer = CommonLayer.RIB_SI
 
     def __post_init__(self):
-        grating_arcs = [grating_arc(self.angle, self.duty_cycle, self.n_core, self.n_env,
-                                    self.fiber_angle, self.wavelength, m, resolution=self.resolution)
-                        for m in range(self.min_period, self.min_period + self.num_periods)]
-        sector = Pattern(np.hstack((np.zeros((2, 1)), grating_arcs[0].curve.geoms[0])))
-        grating = Pattern(grating_arcs, sector)
-        min_waveguide_l = np.abs(self.waveguide_w / np.tan(np.radians(self.angle)))
+        arcs = grating_arcs(self.angle, self.duty_cycle, self.n_core, self.n_env, self.fiber_angle,
+                            self.wavelength, self.min_period, self.num_periods, resolution=self.resolution)
+        arc = arcs.curve.geoms[0]
+        sector_points = np.empty((2, arc.shape[1] + 1), dtype=arc.dtype)
+        sector_points[:, 0] = 0
+        sector_points[:, 1:] = arc
+        grating = Pattern(arcs, Pattern(sector_points))
+        min_waveguide_l = abs(self.waveguide_w / math.tan(math.radians(self.angle)))
         self.waveguide = RibDevice(straight(self.waveguide_extra_l + min_waveguide_l).path(self.waveguide_w),
                                    slab=self.slab, ridge=self.ridge)
         self.waveguide.halign(min_waveguide_l, left=False)
-        super().__init__(self.name,
-                         [(grating.buffer(self.rib_grow), self.slab),
-                          (grating, self.ridge), self.waveguide])
+        # without rib growth the slab only needs the union (merging the sector and first arc), not the buffer
+        slab = Pattern(grating.shapely_union) if self.rib_grow == 0 else grating.buffer(self.rib_grow)
+        super().__init__(self.name, [(slab, self.slab), (grating, self.ridge), self.waveguide])
         self.port['a0'] = self.waveguide.port['a0'].copy
         self.translate(*(-self.port['a0'].xy))  # put the a0 port at 0, 0
 
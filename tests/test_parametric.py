@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from dphox.parametric import grating_arc, grating_arcs, turn, turn_sbend
+
+
+@pytest.mark.parametrize(
+    "angle, duty_cycle, n_core, n_clad, fiber_angle, wavelength, min_period, num_periods, resolution",
+    [
+        [22.5, 0.5, 3.4784, 1, 82, 1.55, 40, 5, 99],
+        [-30, 0.3, 3.4784, 1.4442, 80, 1.31, 20, 3, 21],
+    ],
+)
+def test_grating_arcs(angle: float, duty_cycle: float, n_core: float, n_clad: float, fiber_angle: float,
+                      wavelength: float, min_period: int, num_periods: int, resolution: int):
+    args = (angle, duty_cycle, n_core, n_clad, fiber_angle, wavelength)
+    arcs = grating_arcs(*args, min_period, num_periods, resolution=resolution, include_width=False)
+    # closed-form arc radius for each grating index (see https://www.ncbi.nlm.nih.gov/pmc/articles/PMC7407772/)
+    n_eff = np.sqrt(duty_cycle * n_core ** 2 + (1 - duty_cycle) * n_clad ** 2)
+    angles = np.abs(np.radians(angle)) * (np.linspace(0, 1, resolution) - 0.5)
+    cos_fiber = np.cos(np.radians(fiber_angle))
+    assert arcs.num_geoms == num_periods
+    for i, m in enumerate(range(min_period, min_period + num_periods)):
+        radius = m * wavelength / (n_eff - n_clad * cos_fiber * np.cos(angles))
+        np.testing.assert_allclose(arcs.geoms[i], (radius * np.cos(angles), radius * np.sin(angles)), atol=1e-9)
+        np.testing.assert_allclose(arcs.tangents[i], np.gradient(arcs.geoms[i], axis=1), atol=1e-9)
+        arc = grating_arc(*args, m, resolution=resolution, include_width=False)
+        np.testing.assert_allclose(arc.geoms[0], arcs.geoms[i])
+    paths = grating_arcs(*args, min_period, num_periods, resolution=resolution)
+    for i, path in enumerate(paths.geoms):
+        np.testing.assert_allclose(path, grating_arc(*args, min_period + i, resolution=resolution).geoms[0])
+
+
+@pytest.mark.parametrize("euler", [0, 0.2, 0.5])
+def test_zero_angle_turn(euler: float):
+    curve = turn(5, 0, euler)
+    np.testing.assert_allclose(curve.points, 0)
+    np.testing.assert_allclose(curve.port['a0'].xya, (0, 0, -180), atol=1e-6)
+    np.testing.assert_allclose(curve.port['b0'].xya, (0, 0, 0), atol=1e-6)
+
+
+def test_zero_height_turn_sbend():
+    assert np.all(np.isfinite(turn_sbend(0, 5, 0.2).points))
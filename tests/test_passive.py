@@ -0,0 +1,111 @@
+from typing import Dict, Tuple
+
+import numpy as np
+import pytest
+from shapely.geometry import Polygon
+from shapely.ops import unary_union
+
+from dphox.pattern import Circle
+from dphox.prefab.passive import Array, DC, FocusingGrating, Interposer, TapDC
+
+
+@pytest.mark.parametrize(
+    "dc, lower_curve_port, upper_curve_port",
+    [
+        [DC(0.5, 0.3, 10, 2, 5, euler=0.2),
+         {'a0': (0, 0, -180), 'b0': (6.2, 0, 0)}, {'a0': (0, 10, -180), 'b0': (6.2, 10, 0)}],
+        [DC(0.5, 0.3, 10, 2, 5, euler=0.2, end_l=1, coupler_waveguide_w=0.4),
+         {'a0': (0, 0, -180), 'b0': (8.2, 0, 0)}, {'a0': (0, 10, -180), 'b0': (8.2, 10, 0)}],
+    ],
+)
+def test_dc_curve_port(dc: DC, lower_curve_port: Dict[str, Tuple[float, float, float]],
+                       upper_curve_port: Dict[str, Tuple[float, float, float]]):
+    for path, expected_port in ((dc.lower_path, lower_curve_port), (dc.upper_path, upper_curve_port)):
+        assert set(path.curve.port) == set(expected_port)
+        for name, xya in expected_port.items():
+            port = path.curve.port[name]
+            np.testing.assert_allclose((port.x, port.y, port.a), xya, atol=1e-6)
+            np.testing.assert_allclose(port.xya, xya, atol=1e-6)
+
+
+def test_tap_dc_copy():
+    tap = TapDC(DC(0.5, 0.3, 10, 2, 5), radius=5)
+    bounds = tap.dc.bounds
+    tap_copy = tap.copy
+    assert tap_copy.dc is not tap.dc
+    assert tap_copy.wg_path is tap_copy.dc.lower_path
+    assert tap_copy.dc.lower_path is tap_copy.dc.refs[0]
+    tap_copy.dc.translate(100, 0)
+    assert tap.dc.bounds == bounds
+    np.testing.assert_allclose(tap_copy.wg_path.bounds, tap.wg_path.bounds + np.array((100, 0, 100, 0)))
+    # ports shared between the tap and its dc remain shared in the copy, as they are for the original
+    tap_copy = tap.copy
+    assert tap_copy.port['a0'] is tap_copy.dc.port['a0']
+    tap_copy.translate(100, 0)
+    np.testing.assert_allclose(tap_copy.dc.port['a0'].xya, tap.copy.translate(100, 0).port['a0'].xya)
+    np.testing.assert_allclose(tap_copy.dc.port['a0'].xya, (100, 0, -180), atol=1e-6)
+    np.testing.assert_allclose(tap.dc.port['a0'].xya, (0, 0, -180), atol=1e-6)
+
+
+def test_interposer_copy():
+    interposer = Interposer(0.5, 4, 10, 5, trombone_radius=5)
+    interposer_copy = interposer.copy
+    assert len(interposer_copy.paths) == len(interposer.paths)
+    for path, path_copy in zip(interposer.paths, interposer_copy.paths):
+        assert path_copy is not path
+        np.testing.assert_allclose(path_copy.points, path.points)
+    interposer_copy.translate(0, 50)
+    np.testing.assert_allclose(interposer_copy.paths[-1].port['a0'].xya, interposer_copy.port['l0'].xya)
+    np.testing.assert_allclose(interposer_copy.port['l0'].xya, interposer.port['l0'].xya + np.array((0, 50, 0)))
+    interposer_copy.init_pos[0, 0] = 1e3
+    assert interposer.init_pos[0, 0] != 1e3
+
+
+def test_array_copy():
+    array = Array(Circle(0.2, 8), (2, 3), 1.0)
+    array_copy = array.copy
+    assert array_copy.unit is not array.unit
+    bounds = array.unit.bounds
+    array_copy.unit.translate(5, 5)
+    assert array.unit.bounds == bounds
+    array_copy.pitch[0] = 9
+    np.testing.assert_allclose(array.pitch, (1, 1))
+
+
+def _assert_same_geometry(geom, expected):
+    assert len(geom.geoms) == len(expected.geoms)
+    for poly, expected_poly in zip(geom.geoms, expected.geoms):
+        np.testing.assert_allclose(poly, expected_poly)
+    assert set(geom.port) == set(expected.port)
+    for name, port in expected.port.items():
+        np.testing.assert_allclose(geom.port[name].xya, port.xya)
+        np.testing.assert_allclose(geom.port[name].w, port.w)
+    assert len(geom.refs) == len(expected.refs)
+    for ref, expected_ref in zip(geom.refs, expected.refs):
+        _assert_same_geometry(ref, expected_ref)
+    assert (geom.curve is None) == (expected.curve is None)
+    if expected.curve is not None:
+        _assert_same_geometry(geom.curve, expected.curve)
+        for tangent, expected_tangent in zip(geom.curve.tangents, expected.curve.tangents):
+            np.testing.assert_allclose(tangent, expected_tangent)
+
+
+@pytest.mark.parametrize(
+    "dx, dy",
+    [[0, 0], [3.5, -2.25], [-1e-3, 100]],
+)
+def test_dc_copy_translated(dx: float, dy: float):
+    dc = DC(0.5, 0.3, 10, 2, 5, euler=0.2)
+    dc_translated = dc.copy_translated(dx, dy)
+    _assert_same_geometry(dc_translated, dc.copy.translate(dx, dy))
+    assert dc_translated.lower_path is dc_translated.refs[0]
+    _assert_same_geometry(dc, DC(0.5, 0.3, 10, 2, 5, euler=0.2))
+
+
+@pytest.mark.parametrize("rib_grow", [0, 1])
+def test_focusing_grating_slab(rib_grow: float):
+    grating = FocusingGrating(num_periods=5, rib_grow=rib_grow)
+    slab = [Polygon(p.T) for p in grating.layer_to_polys[grating.slab]]
+    # the sector and first arc overlap, so the slab must be merged into non-overlapping polygons
+    assert len(slab) == (5 if rib_grow == 0 else 1)
+    np.testing.assert_allclose(sum(p.area for p in slab), unary_union(slab).area)
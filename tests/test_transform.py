@@ -54,3 +54,63 @@ def test_scale(pattern: Pattern, xfact: int, yfact: int, origin: Optional[Tuple[
                expected_polygon: np.ndarray):
     np.testing.assert_allclose(np.asarray(pattern.copy.scale(xfact, yfact, origin=origin).geoms[0]),
                                expected_polygon, rtol=3e-5)
+
+
+@pytest.mark.parametrize(
+    "pattern, origin, horiz, expected_port",
+    [
+        [Box((2, 1)), (0, 0), False, {'c': (0, 0, -180), 'e': (1, 0, -180), 'w': (-1, 0, 0)}],
+        [Box((2, 1)), (1, 1), True, {'c': (2, 0, 0), 'e': (1, 0, 0), 'w': (3, 0, -180)}],
+    ],
+)
+def test_reflect_port_copy(pattern: Pattern, origin: Tuple[float, float], horiz: bool, expected_port: dict):
+    reflected = pattern.copy.reflect(origin, horiz)
+    port_copy = reflected.port_copy
+    for name, xya in expected_port.items():
+        port = port_copy[name]
+        np.testing.assert_allclose((port.x, port.y, port.a), xya, atol=1e-6)
+        np.testing.assert_allclose(port.xya, reflected.port[name].xya)
+        assert port.w == reflected.port[name].w
+
+
+@pytest.mark.parametrize(
+    "update, expected_bounds",
+    [
+        [lambda p: p.translate(1, 2), (0.5, 1.5, 1.5, 2.5)],
+        [lambda p: p.rotate(90, (1, 1)), (1.5, -0.5, 2.5, 0.5)],
+        [lambda p: p.reflect((1, 1), horiz=True), (1.5, -0.5, 2.5, 0.5)],
+        [lambda p: p.scale(2, 1), (-1, -0.5, 1, 0.5)],
+        [lambda p: p.copy.translate(1, 0), (0.5, -0.5, 1.5, 0.5)],
+        [lambda p: p.copy_translated(0, -1), (-0.5, -1.5, 0.5, -0.5)],
+    ],
+)
+def test_bounds_after_transform(update, expected_bounds: Tuple[float, float, float, float]):
+    pattern = Box((1, 1))
+    np.testing.assert_allclose(pattern.bounds, (-0.5, -0.5, 0.5, 0.5))
+    updated = update(pattern)
+    np.testing.assert_allclose(updated.bounds, expected_bounds)
+    np.testing.assert_allclose(updated.size, np.array(expected_bounds[2:]) - np.array(expected_bounds[:2]))
+    np.testing.assert_allclose(updated.center, (np.array(expected_bounds[2:]) + np.array(expected_bounds[:2])) / 2)
+
+
+def test_bounds_after_geoms_update():
+    pattern = Box((1, 1))
+    pattern_copy = pattern.copy
+    np.testing.assert_allclose(pattern.bounds, (-0.5, -0.5, 0.5, 0.5))
+    pattern.geoms += Box((1, 1)).translate(2, 0).geoms
+    np.testing.assert_allclose(pattern.bounds, (-0.5, -0.5, 2.5, 0.5))
+    pattern.geoms.append(Box((1, 1)).translate(0, 3).geoms[0])
+    np.testing.assert_allclose(pattern.bounds, (-0.5, -0.5, 2.5, 3.5))
+    pattern.geoms[0] = Box((1, 1)).translate(-2, 0).geoms[0]
+    np.testing.assert_allclose(pattern.bounds, (-2.5, -0.5, 2.5, 3.5))
+    pattern.geoms = []
+    np.testing.assert_allclose(pattern.bounds, (0, 0, 0, 0))
+    np.testing.assert_allclose(pattern_copy.bounds, (-0.5, -0.5, 0.5, 0.5))
+
+
+def test_bounds_release_old_geoms():
+    pattern = Box((1, 1))
+    pattern.bounds
+    pattern.translate(1, 0)
+    assert pattern._bounds_geoms == ()
+    np.testing.assert_allclose(pattern.bounds, (0.5, -0.5, 1.5, 0.5))